@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Set, TYPE_CHECKING
+from typing import FrozenSet, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from argparse import Namespace
@@ -20,15 +20,15 @@ from common.constants import PROJECT_ROOT
 FOLDER = 'Codemnesis-Output'
 
 EXTENSIONS = {
-    'python': {'.py'},
-    'csharp': {'.cs'}
+    'python': frozenset({'.py'}),
+    'csharp': frozenset({'.cs'})
 }
 
-EXCLUDED = {
+EXCLUDED = frozenset({
     '.git', '.hg', '.svn', '.idea', '.vscode', '.ruff_cache', '.mypy_cache', '.pytest_cache', '.tox', 
     '.eggs', '__pycache__', 'build', 'dist', 'site-packages', 'node_modules', 'venv', '.venv', 'env', 
     '.env', 'bin', 'obj', 'Debug', 'Release', '.vs'
-}
+})
 
 class Settings:
     """
@@ -42,10 +42,10 @@ class Settings:
     """
 
     def __init__(self, args: Namespace) -> None:
-        self.__framework = args.framework.lower()
+        self.__framework = args.framework
         self.__repository = args.repository
         self.__excluded = self.__set_excluded(args.excluded)
-        self.__included = EXTENSIONS.get(self.__framework, set())
+        self.__included = EXTENSIONS.get(self.__framework, frozenset())
         
         if args.output:
             self.__output = os.path.join(args.output, FOLDER)
@@ -61,11 +61,11 @@ class Settings:
         return self.__repository
 
     @property
-    def excluded(self) -> Set[str]:
+    def excluded(self) -> FrozenSet[str]:
         return self.__excluded
     
     @property
-    def included(self) -> Set[str]:
+    def included(self) -> FrozenSet[str]:
         return self.__included
     
     @property
@@ -73,28 +73,31 @@ class Settings:
         return self.__output
 
     @staticmethod
-    def __set_excluded(excluded: str) -> Set[str]:
+    def __set_excluded(excluded: str) -> FrozenSet[str]:
         """
-        Updates the set of directories or files excluded from analysis.
+        Builds the set of directories or files excluded from analysis.
 
-        Converts the received string into a set of values separated by commas, and adds them 
-        to the global set `EXCLUDED`.
+        Converts the received string into a set of values separated by commas, and joins them 
+        with the global set `EXCLUDED`, which is never modified.
 
         Args:
             excluded (str):
                 String with the names of directories or files to exclude, separated by commas.
 
         Returns:
-            Set:
+            FrozenSet:
                 Updated set of exclusions.
         """
-        files_excluded = EXCLUDED.copy()
+        if not excluded:
+            return EXCLUDED
 
-        if excluded:
-            files = {file.strip() for file in excluded.split(',') if file.strip()}
-            files_excluded.update(files)
+        # Usually a single value is received, so the split is avoided in that case
+        if ',' not in excluded:
+            file = excluded.strip()
+            return EXCLUDED.union((file,)) if file else EXCLUDED
 
-        return files_excluded
+        files = (file.strip() for file in excluded.split(','))
+        return EXCLUDED.union(file for file in files if file)
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+import stat
+from typing import Optional, TYPE_CHECKING
 from argparse import ArgumentParser
 
 if TYPE_CHECKING:
@@ -29,15 +30,23 @@ class Arguments:
         - Return the arguments as a `Namespace` object ready for use.
     """
 
+    __args: Optional[Namespace] = None
+
     @classmethod
     def get(cls) -> Namespace:
         """
         Defines, processes, and validates console arguments for algorithm execution.
 
+        The arguments are parsed and validated only on the first call, subsequent calls 
+        return the same `Namespace` object.
+
         Returns:
             Namespace: 
                 Object with parsed and validated arguments.
         """
+        if cls.__args is not None:
+            return cls.__args
+
         parser = ArgumentParser(
             description="Required and optional arguments for executing the algorithm"
         )
@@ -45,6 +54,7 @@ class Arguments:
         parser.add_argument(
             '--framework',
             required=True,
+            type=str.lower,
             choices=['csharp', 'python'],
             help="Programming languages and frameworks supported by the algorithm"
         )
@@ -69,6 +79,7 @@ class Arguments:
 
         cls.__validate(args, parser)
 
+        cls.__args = args
         return args
 
     @staticmethod
@@ -87,8 +98,15 @@ class Arguments:
                 If any validation fails, `parser.error` is invoked, which stops execution 
                 and displays the corresponding error message.
         """
-        if args.output and os.path.exists(args.output) and not os.path.isdir(args.output):
-            parser.error("The parameter sent in `--output` must be a directory!")
+        if args.output:
+            # A single `stat` call is enough to know whether the path exists and whether it is a directory
+            try:
+                is_directory = stat.S_ISDIR(os.stat(args.output).st_mode)
+            except OSError:
+                is_directory = True # It does not exist yet, so it will be created as a directory
+
+            if not is_directory:
+                parser.error("The parameter sent in `--output` must be a directory!")
 
         if not os.path.isdir(args.repository):
             parser.error("The parameter sent in `--repository` must be a valid directory!")
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import os
 import logging
-from logging.handlers import RotatingFileHandler
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from logging import Logger
+    from multiprocessing.queues import Queue
+    from logging.handlers import RotatingFileHandler, QueueListener
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -19,8 +20,15 @@ from common.constants import ALGORITHM
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
+__all__ = ['HandlerLogger']
+
 FILE = 'Trace-Report.log'
 
+FORMATTER = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+"""
+Formatter shared by all the handlers of the application.
+"""
+
 class HandlerLogger:
     """
     Class responsible for managing the configuration of the logger used in the application.
@@ -47,12 +55,58 @@ class HandlerLogger:
 
         logger.setLevel(logging.DEBUG)
 
+        # Thread and process information is not part of the format, so it is not collected
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         # Prevents messages from being sent to the root logger 
         # so that they are not duplicated in other handlers
         logger.propagate = False
         
         logger.addHandler(cls.__handler(file=os.path.join(output, FILE)))
         logger.addHandler(cls.__stream_handler())
+
+    @classmethod
+    def set_worker(cls, queue: Queue) -> None:
+        """
+        Configures the logger associated with the **Algorithm** layer inside a worker process.
+
+        The worker does not write the records itself, they are sent through the queue to the main 
+        process, where the listener created with `listener` writes them using the handlers of `set`.
+
+        Args:
+            queue (Queue):
+                Queue shared with the main process.
+        """
+        from logging.handlers import QueueHandler
+
+        logger = logging.getLogger(ALGORITHM)
+
+        # Handlers inherited from the main process (when the process is forked) are discarded
+        cls.close(logger)
+
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(QueueHandler(queue))
+
+    @staticmethod
+    def listener(queue: Queue) -> QueueListener:
+        """
+        Creates the listener that writes, in the main process, the records sent by the worker processes.
+
+        Args:
+            queue (Queue):
+                Queue shared with the worker processes.
+
+        Returns:
+            QueueListener:
+                Listener (not started) that uses the handlers currently configured for the **Algorithm** layer.
+        """
+        from logging.handlers import QueueListener
+
+        logger = logging.getLogger(ALGORITHM)
+        return QueueListener(queue, *logger.handlers, respect_handler_level=True)
         
     @staticmethod
     def close(logger: Logger) -> None:
@@ -100,6 +154,9 @@ class HandlerLogger:
             RotatingFileHandler:
                 Handler configured with format and rotation.
         """
+        # Imported here so that `logging.handlers` is only loaded when a file handler is actually needed
+        from logging.handlers import RotatingFileHandler
+
         handler = RotatingFileHandler(
             file, 
             maxBytes=size, 
@@ -108,7 +165,7 @@ class HandlerLogger:
             delay=True # It does not open the file until the first message is written
         )
 
-        handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+        handler.setFormatter(FORMATTER)
         handler.setLevel(level)
 
         return handler
@@ -123,7 +180,7 @@ class HandlerLogger:
                 Handler configured for standard output.
         """
         handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+        handler.setFormatter(FORMATTER)
         handler.setLevel(logging.DEBUG)
 
         return handler
@@ -2,6 +2,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List, NamedTuple, TYPE_CHECKING
 
@@ -17,6 +18,12 @@ from common.constants import PROJECT_ROOT
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
+_ROOT = os.path.join(os.path.normcase(os.path.normpath(PROJECT_ROOT)), '')
+"""
+Normalized project root, computed once and ending with a separator so that sibling 
+directories sharing the same prefix are not considered internal.
+"""
+
 class Trace(NamedTuple):
     filename: str
     line: int
@@ -33,26 +40,25 @@ def error_trace(traces: List[Trace], logger: Logger, error: Exception) -> None:
 
     Args:
         traces (List[Trace]):
-            List of traces obtained using `traceback.extract_tb`.
+            List of traces obtained using `traceback.extract_tb` (or `StackSummary.extract`).
         logger (Logger):
             Instance of the logger where the error will be recorded.
         error (Exception):
             Captured exception that caused the failure.
     """
-    root = _normalize(PROJECT_ROOT)
-
-    internal = [
-        trace for trace in traces
-        if _normalize(trace[0]).startswith(root)
-    ]
+    # The last call in the traceback of the project itself usually 
+    # indicates the point where the internal logic actually failed, 
+    # so the traces are scanned backwards and only until it is found
+    internal = next(
+        (trace for trace in reversed(traces) if _normalize(trace.filename).startswith(_ROOT)), 
+        None
+    )
 
-    if not internal:
+    if internal is None:
         logger.error(f"{error} - No relevant internal traces were found")
         return
     
-    # The last call in the traceback of the project itself usually 
-    # indicates the point where the internal logic actually failed
-    filename, line, funcname, text = internal[-1]
+    filename, line, funcname, text = internal
 
     about = f'while processing {text}' if text else ''
     logger.error(f"{error} occurred {about} in function {funcname} (file: {filename}, line: {line})")
@@ -61,6 +67,9 @@ def _normalize(path: str) -> str:
     """
     Normalize a file path.
 
+    Traceback file names are usually absolute already, so `Path.resolve()` (which hits the file system) 
+    is only used for relative paths; otherwise a purely textual normalization is enough.
+
     Args:
         path (str):
             Path of the file to be normalized.
@@ -69,7 +78,10 @@ def _normalize(path: str) -> str:
         str:
             Normalized path in string format.
     """
-    return str(Path(path).resolve()).lower()
+    if not os.path.isabs(path):
+        path = str(Path(path).resolve())
+
+    return os.path.normcase(os.path.normpath(path))
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
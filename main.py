@@ -18,9 +18,17 @@ from common.constants import ALGORITHM, ALGORITHM_VERSION
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
+MEGABYTE = 1 << 20
+"""
+Number of bytes in a megabyte, used to report the memory consumed.
+"""
+
 if __name__ == '__main__':
-    start = time.time()
-    before = psutil.virtual_memory().used
+    start = time.perf_counter()
+
+    # Memory is measured on the process itself and not on the whole system, which is affected by other programs
+    process = psutil.Process()
+    before = process.memory_info().rss
 
     settings = Settings(Arguments.get())
 
@@ -34,11 +42,11 @@ if __name__ == '__main__':
 
     execute(settings)
 
-    end = time.time()
-    after = psutil.virtual_memory().used
+    end = time.perf_counter()
+    after = process.memory_info().rss
 
-    logger.info(f"Total execution time: {round(end - start, 3)} seconds")
-    logger.info(f"Total memory consumed: {round((after - before) / pow(1024, 2), 2)} megabytes")
+    logger.info(f"Total execution time: {end - start:.3f} seconds")
+    logger.info(f"Total memory consumed: {(after - before) / MEGABYTE:.2f} megabytes")
     HandlerLogger.close(logger)
 
 # ---------------------------------------------------------------------------------------------------------------------
@@ -1,10 +1,14 @@
 # MODULES (EXTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
 import re
+import sys
 import logging
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -21,6 +25,11 @@ from src.utils.metrics import module_metrics
 #   but they are not a substitute for a formal parser, if false positives 
 #   or negatives appear in large projects, this is where you should adjust 
 #   the logic
+#
+#   Patterns whose captures are already limited to ASCII identifiers are 
+#   compiled with `re.ASCII`, `METHOD_RE` and `ATTRIBUTE_RE` keep Unicode 
+#   mode because `\w` must accept non-ASCII type names, and `CLASS_RE` 
+#   because its `\b` would otherwise truncate non-ASCII class names
 
 # Detects definitions of classes, interfaces, records, and structs
 CLASS_RE = re.compile(
@@ -47,19 +56,30 @@ ATTRIBUTE_RE = re.compile(
     re.MULTILINE
 )
 
+# Detects constructors, the captured name must be compared with the name of the class being analyzed
+CONSTRUCTOR_RE = re.compile(
+    r'^\s*(?:public|private|protected|internal)\s*'
+    r'(?:static\s+)?'
+    r'([A-Za-z_][A-Za-z0-9_]*)\s*\([^)]*\)\s*{?',
+    re.MULTILINE | re.ASCII
+)
+
 # Detect using (includes global and alias)
 USING_RE = re.compile(
     r'^\s*(?:global\s+)?using\s+(?:static\s+)?'
     r'(?:[A-Za-z_][A-Za-z0-9_]*\s*=\s*)?'
     r'([A-Za-z_][A-Za-z0-9_.]*)\s*;',
-    re.MULTILINE
+    re.MULTILINE | re.ASCII
 )
 
 # Detect file namespace
 NAMESPACE_RE = re.compile(
     r'^\s*namespace\s+([A-Za-z_][A-Za-z0-9_.]*)\s*(?:{|;)',
-    re.MULTILINE
+    re.MULTILINE | re.ASCII
 )
+
+# Detects the only characters that can change the state of the block scanner outside comments and literals
+BLOCK_TOKEN_RE = re.compile(r'[{}/\'"$@]')
 # ---------------------------------------------------------------------------------------------------------------------
 
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
@@ -72,6 +92,12 @@ logger = logging.getLogger(ALGORITHM)
 Instance of the logger used by the analysis module.
 """
 
+# Kinds of line used when searching for documentation and decorators above a declaration
+LINE_OTHER = 0
+LINE_BLANK = 1
+LINE_DOC = 2        # /// ...
+LINE_ATTRIBUTE = 3  # [Something]
+
 def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
     """
     Analyzes a C# file, obtaining structural information: classes, methods, attributes, 
@@ -101,18 +127,21 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
     """
     src = path.read_text(encoding='utf-8', errors='ignore')
     src = src.lstrip('\ufeff') # Remove the BOM, which is common in files generated by Windows tools
-    lines = src.splitlines()
+    lines = [line.strip() for line in src.splitlines()]
+    kinds = _classify_lines(lines)
+    newlines = _newline_offsets(src)
 
     classes: List[ClassInfo] = []
+    unclosed: List[str] = []
 
     for cls_match in CLASS_RE.finditer(src):
         cls_name = cls_match.group(2)
-        cls_lineno = src.count('\n', 0, cls_match.start()) + 1 # Exact line where the class begins
+        cls_lineno = _line_number(newlines, cls_match.start()) # Exact line where the class begins
         cls_info = ClassInfo(
             name=cls_name, 
             lineno=cls_lineno, 
-            doc=_collect_xml_text(lines, cls_lineno - 1), 
-            decorators=_collect_decorators(lines, cls_lineno - 1)
+            doc=_collect_xml_text(lines, kinds, cls_lineno - 1), 
+            decorators=_collect_decorators(lines, kinds, cls_lineno - 1)
         )
 
         # Search for the nearest { key after the declaration
@@ -121,53 +150,53 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
         idx_brace = src.find('{', cls_match.end())
         if idx_brace == -1:
             kind = cls_match.group(1) # class, record, struct, interface
-            logger.warning(f"Could not find '{{' for {kind} {cls_name} in {path.name} (Line {cls_lineno})")
+            unclosed.append(f'{kind} {cls_name} (Line {cls_lineno})')
             classes.append(cls_info)
             continue
 
         block = _extract_text_block(src, idx_brace)
 
-        # It is compiled dynamically because the constructor name = class name
-        CONSTRUCTOR_RE = re.compile(
-            rf'^\s*(?:public|private|protected|internal)\s*'
-            rf'(?:static\s+)?'
-            rf'{re.escape(cls_name)}\s*\([^)]*\)\s*{{?',
-            re.MULTILINE
-        )
-
         for ctor in CONSTRUCTOR_RE.finditer(block):
-            ctor_lineno = src.count('\n', 0, idx_brace + ctor.start()) + 1
+            # Only the constructors of this class are kept (constructor name = class name)
+            if ctor.group(1) != cls_name:
+                continue
+
+            ctor_lineno = _line_number(newlines, idx_brace + ctor.start())
             cls_info.methods.append(
                 FunctionInfo(
                     name=cls_name, 
                     lineno=ctor_lineno, 
-                    doc=_collect_xml_text(lines, ctor_lineno - 1)
+                    doc=_collect_xml_text(lines, kinds, ctor_lineno - 1)
                 )
             )
 
         for method in METHOD_RE.finditer(block):
-            method_lineno = src.count('\n', 0, idx_brace + method.start()) + 1
+            method_lineno = _line_number(newlines, idx_brace + method.start())
             cls_info.methods.append(
                 FunctionInfo(
                     name=method.group(1),
                     lineno=method_lineno,
-                    doc=_collect_xml_text(lines, method_lineno - 1),
-                    decorators=_collect_decorators(lines, method_lineno - 1)
+                    doc=_collect_xml_text(lines, kinds, method_lineno - 1),
+                    decorators=_collect_decorators(lines, kinds, method_lineno - 1)
                 )
             )
 
         for attr in ATTRIBUTE_RE.finditer(block):
-            attr_lineno = src.count('\n', 0, idx_brace + attr.start()) + 1
+            attr_lineno = _line_number(newlines, idx_brace + attr.start())
             cls_info.attributes.append(
                 AttributeInfo(
                     name=attr.group(1), 
                     lineno=attr_lineno, 
-                    doc=_collect_xml_text(lines, attr_lineno - 1)
+                    doc=_collect_xml_text(lines, kinds, attr_lineno - 1)
                 )
             )
 
         classes.append(cls_info)
 
+    # A single warning is emitted per file with all the declarations affected
+    if unclosed:
+        logger.warning(f"Could not find '{{' for {', '.join(unclosed)} in {path.name}")
+
     return ModuleInfo(
         path=str(path),
         doc=None,           # C# does not have docstrings at the module level
@@ -177,6 +206,75 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
         metrics=module_metrics(src, classes, [], framework)
     )
 
+def _newline_offsets(src: str) -> array:
+    """
+    Obtains the positions of all line breaks in the source, in ascending order.
+
+    It is calculated only once per file so that the line number of each match can be 
+    resolved with a binary search instead of counting line breaks from the beginning.
+
+    Args:
+        src (str):
+            Complete content of the C# file in text format.
+
+    Returns:
+        array:
+            Ordered array of integers with the index of each `\\n` character within `src`; unlike 
+            a list, it does not create an object for each position.
+    """
+    offsets = array('q')
+    idx = src.find('\n')
+
+    while idx != -1:
+        offsets.append(idx)
+        idx = src.find('\n', idx + 1)
+
+    return offsets
+
+def _line_number(newlines: array, position: int) -> int:
+    """
+    Converts a position within the source into its line number (1-based).
+
+    Equivalent to `src.count('\\n', 0, position) + 1`, but in logarithmic time.
+
+    Args:
+        newlines (array):
+            Ordered positions of the line breaks, obtained with `_newline_offsets`.
+        position (int):
+            Index (0-based) within the source.
+
+    Returns:
+        int:
+            Line number where the position is located.
+    """
+    return bisect_left(newlines, position) + 1
+
+def _classify_lines(lines: List[str]) -> bytearray:
+    """
+    Classifies each line of the file only once, so that the upward searches for documentation 
+    and decorators do not have to analyze the same text again for every declaration.
+
+    Args:
+        lines (List[str]):
+            Lines of the source file, already stripped of leading and trailing whitespace.
+
+    Returns:
+        bytearray:
+            Kind of each line (`LINE_OTHER`, `LINE_BLANK`, `LINE_DOC` or `LINE_ATTRIBUTE`), 
+            in the same order as `lines`.
+    """
+    kinds = bytearray(len(lines))
+
+    for idx, line in enumerate(lines):
+        if not line:
+            kinds[idx] = LINE_BLANK
+        elif line.startswith('///'):
+            kinds[idx] = LINE_DOC
+        elif line.startswith('[') and line.endswith(']'):
+            kinds[idx] = LINE_ATTRIBUTE
+
+    return kinds
+
 def _extract_text_block(src: str, idx_brace: int) -> str:
     """
     Extracts a block of code delimited by curly braces `{ ... }` from a known starting position, 
@@ -188,7 +286,8 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
 
     **The algorithm:**
         - Starts at the position of the opening `{` character.
-        - Advances character by character, maintaining a curly brace depth counter.
+        - Advances character by character, maintaining a curly brace depth counter. Plain code and 
+        comments are skipped up to the next character that can change the state.
         - Increments the depth only when it finds `{` outside of any literal or comment.
         - Decrements the depth only when it finds `}` outside of any literal or comment.
         - Ends when the depth returns to zero, indicating the correct closure of the block.
@@ -233,18 +332,23 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
         # ==========================================================
         # 1) Handle comment states
         # ==========================================================
+        # The end of the comment is searched directly instead of advancing character by character
         if in_single_line_comment:
-            if current_char == '\n':
-                in_single_line_comment = False
+            cursor = src.find('\n', cursor)
+            if cursor == -1:
+                break
+
+            in_single_line_comment = False
             cursor += 1
             continue
 
         if in_multi_line_comment:
-            if current_char == '*' and next_char == '/':
-                in_multi_line_comment = False
-                cursor += 2
-            else:
-                cursor += 1
+            cursor = src.find('*/', cursor)
+            if cursor == -1:
+                break
+
+            in_multi_line_comment = False
+            cursor += 2
             continue
 
         # ==========================================================
@@ -327,7 +431,18 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
             continue
 
         # ==========================================================
-        # 5) Detect comment entry
+        # 5) Skip plain code up to the next relevant character
+        # ==========================================================
+        if current_char not in '{}/\'"$@':
+            token = BLOCK_TOKEN_RE.search(src, cursor)
+            if token is None:
+                break
+
+            cursor = token.start()
+            continue
+
+        # ==========================================================
+        # 6) Detect comment entry
         # ==========================================================
         if current_char == '/' and next_char == '/':
             in_single_line_comment = True
@@ -340,7 +455,7 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
             continue
 
         # ==========================================================
-        # 6) Detect char literal entry
+        # 7) Detect char literal entry
         # ==========================================================
         if current_char == "'":
             in_char_literal = True
@@ -349,7 +464,7 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
             continue
 
         # ==========================================================
-        # 7) Detect raw string entry
+        # 8) Detect raw string entry
         # ==========================================================
         # Case: """..."""
         if current_char == '"':
@@ -394,7 +509,7 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
             continue
 
         # ==========================================================
-        # 8) Detect string entry (@"...", $"...", $@"...", @$"...")
+        # 9) Detect string entry (@"...", $"...", $@"...", @$"...")
         # ==========================================================
         if current_char in ('@', '$'):
             if next_char == '"':
@@ -416,7 +531,7 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
                 continue
 
         # ==========================================================
-        # 9) Count braces (ONLY here)
+        # 10) Count braces (ONLY here)
         # ==========================================================
         if current_char == '{':
             brace_depth += 1
@@ -429,7 +544,7 @@ def _extract_text_block(src: str, idx_brace: int) -> str:
 
     return src[idx_brace:]
 
-def _collect_xml_text(lines: List[str], start_idx: int) -> Optional[str]:
+def _collect_xml_text(lines: List[str], kinds: bytearray, start_idx: int) -> Optional[str]:
     """
     Extracts, interprets, and converts XML documentation preceding a class or method.
 
@@ -454,7 +569,9 @@ def _collect_xml_text(lines: List[str], start_idx: int) -> Optional[str]:
 
     Args:
         lines (List[str]):
-            List of lines from the source file.
+            List of lines from the source file, stripped of leading and trailing whitespace.
+        kinds (bytearray):
+            Kind of each line, obtained with `_classify_lines`.
         start_idx (int):
             Index where the class or method appears, used to search documentation upwards.
 
@@ -467,21 +584,17 @@ def _collect_xml_text(lines: List[str], start_idx: int) -> Optional[str]:
 
     # It ascends by collecting lines with C# XML format: /// ...
     while idx >= 0:
-        txt = lines[idx].rstrip()
+        kind = kinds[idx]
 
         # The 3 slashes are removed and the content is stored
-        if txt.strip().startswith('///'):
-            buffer.append(txt.strip().lstrip('/').strip())
-            idx -= 1
-            continue
-
-        # Blank lines are allowed between documentation
-        if txt.strip() == '':
+        if kind == LINE_DOC:
+            buffer.append(lines[idx].lstrip('/').strip())
             idx -= 1
             continue
 
-        # If an attribute [Something] exists, the search continues upwards
-        if txt.strip().startswith('[') and txt.strip().endswith(']'):
+        # Blank lines are allowed between documentation and if an 
+        # attribute [Something] exists, the search continues upwards
+        if kind == LINE_BLANK or kind == LINE_ATTRIBUTE:
             idx -= 1
             continue
 
@@ -491,8 +604,26 @@ def _collect_xml_text(lines: List[str], start_idx: int) -> Optional[str]:
         return None
 
     buffer.reverse()
-    raw = '\n'.join(buffer)
 
+    return _parse_xml_documentation('\n'.join(buffer))
+
+@lru_cache(maxsize=4096)
+def _parse_xml_documentation(raw: str) -> str:
+    """
+    Interprets the raw text of a documentation block as XML and formats it.
+
+    The result depends only on the text of the block, so it is cached: the boilerplate documentation 
+    that is repeated across many members (common in generated code) is only parsed once.
+
+    Args:
+        raw (str):
+            Documentation lines, without the `///` prefix, joined by line breaks.
+
+    Returns:
+        str:
+            Formatted documentation, or the raw text if it does not contain relevant tags or 
+            is not valid XML.
+    """
     if not any(tag in raw for tag in ('<summary', '<param', '<returns', '<exception')):
         return raw
 
@@ -584,6 +715,9 @@ def _xml_node_to_text(node: ET.Element) -> str:
         - Processes nested nodes while maintaining the natural order of the text.
         - Respects the content before, between, and after child nodes.
 
+    The tree is traversed with an explicit stack instead of recursion, so all the fragments 
+    are collected in a single list and joined only once.
+
     Args:
         node (Element[str]):
             XML node to be transformed.
@@ -593,40 +727,48 @@ def _xml_node_to_text(node: ET.Element) -> str:
             Clean, readable text corresponding to the node's content.
     """
     parts: List[str] = []
+    stack: List[Union[ET.Element, str]] = [node]
 
-    if node.text and node.text.strip():
-        parts.append(node.text.strip())
+    while stack:
+        item = stack.pop()
 
-    for child in node:
-        if child.tag == 'see':
-            cref = child.attrib.get('cref', '').strip()
-            
-            # Sometimes it comes as T:Namespace.Type
-            if ':' in cref:
-                cref = cref.split(':', 1)[-1]
+        # Text already resolved (tails, references), it is added as is
+        if isinstance(item, str):
+            parts.append(item)
+            continue
 
-            if cref:
-                parts.append(cref)
+        if item.text and not item.text.isspace():
+            parts.append(item.text.strip())
 
-        elif child.tag == 'paramref':
-            name = child.attrib.get('name', '').strip()
-            
-            if name:
-                parts.append(name)
+        # Children are stacked in reverse order so that they are processed in their natural order
+        for child in reversed(item):
+
+            # Text following the daughter tag
+            if child.tail and not child.tail.isspace():
+                stack.append(child.tail.strip())
 
-        else:
-            text_child = _xml_node_to_text(child)
-            
-            if text_child:
-                parts.append(text_child)
+            if child.tag == 'see':
+                cref = child.attrib.get('cref', '').strip()
+                
+                # Sometimes it comes as T:Namespace.Type
+                if ':' in cref:
+                    cref = cref.split(':', 1)[-1]
 
-        # Text following the daughter tag
-        if child.tail and child.tail.strip():
-            parts.append(child.tail.strip())
+                if cref:
+                    stack.append(cref)
+
+            elif child.tag == 'paramref':
+                name = child.attrib.get('name', '').strip()
+                
+                if name:
+                    stack.append(name)
+
+            else:
+                stack.append(child)
 
     return ' '.join(parts)
 
-def _collect_decorators(lines: List[str], start_idx: int) -> List[str]:
+def _collect_decorators(lines: List[str], kinds: bytearray, start_idx: int) -> List[str]:
     """
     Extracts C#-style decorators (attributes) applied to a class, method, constructor, or field.
 
@@ -640,7 +782,9 @@ def _collect_decorators(lines: List[str], start_idx: int) -> List[str]:
 
     Args:
         lines (List[str]):
-            The file content split into lines.
+            The file content split into lines, stripped of leading and trailing whitespace.
+        kinds (bytearray):
+            Kind of each line, obtained with `_classify_lines`.
         start_idx (int):
             Zero-based index of the declaration line; the search starts from the line above it.
 
@@ -652,14 +796,16 @@ def _collect_decorators(lines: List[str], start_idx: int) -> List[str]:
     idx = start_idx - 1
 
     while idx >= 0:
-        txt = lines[idx].rstrip()
+        kind = kinds[idx]
 
-        if txt.strip().startswith('[') and txt.strip().endswith(']'):
-            attrs.append(txt.strip())
+        # The same attributes are repeated throughout a project ([Serializable], [HttpGet], ...), 
+        # so they are interned to share a single object for each distinct text
+        if kind == LINE_ATTRIBUTE:
+            attrs.append(sys.intern(lines[idx]))
             idx -= 1
             continue
 
-        if txt.strip().startswith('///'):
+        if kind == LINE_DOC:
             idx -= 1
             continue
 
@@ -690,13 +836,11 @@ def _collect_imports(src: str) -> List[str]:
             using `using` statements.
     """
     src = src.lstrip('\ufeff')
-    namespaces = sorted({item.group(1) for item in NAMESPACE_RE.finditer(src)})
-    usings = sorted({item.group(1) for item in USING_RE.finditer(src)})
-
-    imports: List[str] = []
-    for ns in namespaces:
-        imports.append(f'__ns__:{ns}')
+    # Both regexes have a single group, so `findall` directly returns the captured names
+    namespaces = sorted(set(NAMESPACE_RE.findall(src)))
+    usings = sorted(set(USING_RE.findall(src)))
 
+    imports = [f'__ns__:{ns}' for ns in namespaces]
     imports.extend(usings)
 
     return imports
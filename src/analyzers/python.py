@@ -2,9 +2,11 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 import ast
+import sys
 import inspect
 import logging
 from pathlib import Path
+from functools import lru_cache
 from typing import List, Tuple, Optional
 # ---------------------------------------------------------------------------------------------------------------------
 
@@ -31,6 +33,19 @@ RETURNS = ('Returns:', 'Return:')
 SECTIONS = ('Args:', 'Arguments:', 'Parameters:')
 RAISES = ('Raises:', 'Raise:', 'Exceptions:', 'Exception:')
 
+# Markdown header corresponding to each section header
+HEADERS_MAP = {
+    **{item: '*Args:*'    for item in SECTIONS},
+    **{item: '*Returns:*' for item in RETURNS},
+    **{item: '*Raises:*'  for item in RAISES},
+}
+
+# Detects the items of a section with the pattern → name: description
+BLOCK_ITEM_RE = re.compile(r'\s*([^:]+):\s*(.*)')
+
+# Detects each line of the source with its line break, only `\r\n`, `\r` and `\n` are line breaks for the parser
+SOURCE_LINE_RE = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+$')
+
 # AST nodes that are commonly expected at module level and should not be considered "unexpected"
 EXPECTED_TOP_LEVEL_NODES = (
     ast.Import,
@@ -42,6 +57,10 @@ EXPECTED_TOP_LEVEL_NODES = (
     ast.Pass
 )
 
+# Fields of the AST nodes that contain lists of statements (`handlers` and `cases` contain nodes 
+# that in turn have a `body`), the only places where an import can appear
+STATEMENT_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
 def analyze_python(path: Path, framework: str) -> ModuleInfo:
     """
     Analyzes a Python file and extracts structural information about its modules, classes, and functions.
@@ -72,6 +91,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
     """
     src = path.read_text(encoding='utf-8', errors='ignore')
     tree = ast.parse(src)
+    src_lines = _source_lines(src)
     doc = ast.get_docstring(tree)
 
     funcs: List[FunctionInfo] = []
@@ -84,7 +104,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
                     name=node.name,
                     lineno=node.lineno,
                     doc=_normalize_document(ast.get_docstring(node)),
-                    decorators=_collect_decorators(node, src)
+                    decorators=_collect_decorators(node, src_lines)
                 )
             )
         elif isinstance(node, ast.ClassDef): # Classes
@@ -92,7 +112,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
                 name=node.name,
                 lineno=node.lineno,
                 doc=_normalize_document(ast.get_docstring(node)),
-                decorators=_collect_decorators(node, src)
+                decorators=_collect_decorators(node, src_lines)
             )
 
             for sub in node.body:
@@ -101,7 +121,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
                         name=sub.name,
                         lineno=sub.lineno,
                         doc=_normalize_document(ast.get_docstring(sub)),
-                        decorators=_collect_decorators(sub, src)
+                        decorators=_collect_decorators(sub, src_lines)
                     ))
 
                 elif isinstance(sub, ast.Assign): # Class attributes
@@ -153,12 +173,14 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
         metrics=module_metrics(src, classes, funcs, framework)
     )
 
+@lru_cache(maxsize=4096)
 def _normalize_document(doc: Optional[str]) -> Optional[str]:
     """
     Normalizes and formats a docstring to produce consistent Markdown output.
 
     This function processes Python docstrings and transforms them into a standard format, 
-    suitable for inclusion in a README file. 
+    suitable for inclusion in a README file. The result depends only on the docstring, so it 
+    is cached and repeated docstrings (overridden methods, boilerplate) are only normalized once.
     
     **It automatically recognizes typical documentation sections such as:**
         - Args / Arguments / Parameters
@@ -191,24 +213,24 @@ def _normalize_document(doc: Optional[str]) -> Optional[str]:
         return doc
 
     txt = inspect.cleandoc(doc)
+
+    # All section headers end with `:`, without it the lines only need 
+    # the bullets and asterisks fixed, which can be done on the whole text
+    if ':' not in txt:
+        return fix_asterisk(fix_bullets(txt))
+
     lines = txt.splitlines()
 
     idx = 0
     out: List[str] = []
     num_lines = len(lines)
 
-    headers_map = {
-        **{item: '*Args:*'    for item in SECTIONS},
-        **{item: '*Returns:*' for item in RETURNS},
-        **{item: '*Raises:*'  for item in RAISES},
-    }
-
     while idx < num_lines:
         line = lines[idx]
         stripped = line.strip()
 
-        if stripped in headers_map:
-            out.append(headers_map[stripped])
+        if stripped in HEADERS_MAP:
+            out.append(HEADERS_MAP[stripped])
             idx += 1
 
             idx, items = _format_block_text(idx, num_lines, lines)
@@ -256,23 +278,24 @@ def _format_block_text(idx: int, num_lines: int, lines: List[str]) -> Tuple[int,
     items: List[str] = []
     idx_local = idx
 
-    while idx_local < num_lines and (
-        lines[idx_local].startswith('    ')
-        or lines[idx_local].startswith('\t')
-        or not lines[idx_local].strip()
-    ):
+    while idx_local < num_lines:
         cursor = lines[idx_local]
+        content = cursor.lstrip() # Calculated only once, it is used for the blank check and the indentation
 
         # Skip blank lines without cutting the block
-        if not cursor.strip():
+        if not content:
             idx_local += 1
             continue
+
+        # The block ends at the first line that is not indented
+        if not cursor.startswith(('    ', '\t')):
+            break
         
         # Current indentation level
-        indent = len(cursor) - len(cursor.lstrip())
+        indent = len(cursor) - len(content)
 
         # It attempts to detect the pattern → name: description
-        match_cursor = re.match(r'\s*([^:]+):\s*(.*)', cursor)
+        match_cursor = BLOCK_ITEM_RE.match(cursor)
 
         if match_cursor:
             name = match_cursor.group(1).strip()
@@ -283,16 +306,17 @@ def _format_block_text(idx: int, num_lines: int, lines: List[str]) -> Tuple[int,
             extra: List[str] = []
             while jdx < num_lines:
                 nxt = lines[jdx]
+                nxt_content = nxt.lstrip()
 
-                if not nxt.strip():
+                if not nxt_content:
                     jdx += 1
                     continue
 
-                nxt_indent = len(nxt) - len(nxt.lstrip())
+                nxt_indent = len(nxt) - len(nxt_content)
                 if nxt_indent <= indent:
                     break
 
-                extra.append(nxt.strip())
+                extra.append(nxt_content.rstrip())
                 jdx += 1
 
             if extra:
@@ -303,12 +327,12 @@ def _format_block_text(idx: int, num_lines: int, lines: List[str]) -> Tuple[int,
             idx_local = jdx
         else:
             # Line without pattern → name: value, treated as a generic list element
-            items.append(f"- {cursor.strip().replace('- ', '')}")
+            items.append(f"- {content.rstrip().replace('- ', '')}")
             idx_local += 1
 
     return idx_local, items
 
-def _collect_decorators(node: ast.AST, src: str) -> List[str]:
+def _collect_decorators(node: ast.AST, src_lines: List[str]) -> List[str]:
     """
     Extracts the decorators applied to a function or class in Python code.
 
@@ -319,8 +343,8 @@ def _collect_decorators(node: ast.AST, src: str) -> List[str]:
     Args:
         node (AST):
             Node of the syntax tree that may contain decorators.
-        src (str):
-            Full content of the source file where the node is located.
+        src_lines (List[str]):
+            Lines of the source file where the node is located, obtained with `_source_lines`.
 
     Returns:
         List:
@@ -330,7 +354,7 @@ def _collect_decorators(node: ast.AST, src: str) -> List[str]:
     decorators: List[str] = []
 
     for decorator in getattr(node, 'decorator_list', []):
-        text = ast.get_source_segment(src, decorator) # Attempts to retrieve the exact text from the source code
+        text = _source_segment(src_lines, decorator) # Attempts to retrieve the exact text from the source code
 
         if text is None:
             try:
@@ -338,10 +362,66 @@ def _collect_decorators(node: ast.AST, src: str) -> List[str]:
             except Exception:
                 text = repr(decorator) # And if that also fails, it reverts to a generic repr
 
-        decorators.append(text.lstrip('@').strip())
+        # The same decorators are repeated throughout a project (property, staticmethod, ...), 
+        # so they are interned to share a single object for each distinct text
+        decorators.append(sys.intern(text.lstrip('@').strip()))
 
     return decorators
 
+def _source_lines(src: str) -> List[str]:
+    """
+    Splits the source into lines, keeping the line breaks, in the same way as the parser does.
+
+    Only `\\r\\n`, `\\r` and `\\n` are considered line breaks (unlike `str.splitlines`), so the 
+    positions of the nodes match the resulting lines. It is calculated only once per file, instead 
+    of on every call to `ast.get_source_segment`.
+
+    Args:
+        src (str):
+            Full content of the source file.
+
+    Returns:
+        List:
+            Lines of the source file, including their line breaks.
+    """
+    return SOURCE_LINE_RE.findall(src)
+
+def _source_segment(src_lines: List[str], node: ast.AST) -> Optional[str]:
+    """
+    Obtains the source code fragment that generated a node, equivalent to `ast.get_source_segment`.
+
+    The column offsets of the nodes are expressed in UTF-8 bytes, so the lines are encoded 
+    before slicing them.
+
+    Args:
+        src_lines (List[str]):
+            Lines of the source file, obtained with `_source_lines`.
+        node (AST):
+            Node of the syntax tree whose text is to be retrieved.
+
+    Returns:
+        (str | None):
+            Exact text of the node, or None if the node does not have complete position information.
+    """
+    try:
+        if node.end_lineno is None or node.end_col_offset is None:
+            return None
+
+        lineno = node.lineno - 1
+        end_lineno = node.end_lineno - 1
+        col_offset = node.col_offset
+        end_col_offset = node.end_col_offset
+    except AttributeError:
+        return None
+
+    if end_lineno == lineno:
+        return src_lines[lineno].encode()[col_offset:end_col_offset].decode()
+
+    first = src_lines[lineno].encode()[col_offset:].decode()
+    last = src_lines[end_lineno].encode()[:end_col_offset].decode()
+
+    return ''.join([first, *src_lines[lineno + 1:end_lineno], last])
+
 def _collect_imports(tree: ast.AST) -> List[str]:
     """
     Extracts all imports present in a Python module from its AST.
@@ -356,8 +436,13 @@ def _collect_imports(tree: ast.AST) -> List[str]:
     """
     imports: List[str] = []
 
-    # ast.walk traverses the entire tree in depth
-    for node in ast.walk(tree):
+    # Imports are statements, so only the statement lists of each node are traversed (including the bodies 
+    # of functions and classes, where deferred imports are placed) without going into the expressions
+    stack: List[ast.AST] = list(tree.body)
+
+    while stack:
+        node = stack.pop()
+
         if isinstance(node, ast.Import):
             for alias in node.names:
                 imports.append(alias.name)
@@ -369,7 +454,10 @@ def _collect_imports(tree: ast.AST) -> List[str]:
                 else:
                     imports.append(alias.name) # Relative imports without explicit module
         else:
-            pass # Ignored: AST nodes that do not represent imports
+            for field in STATEMENT_FIELDS:
+                children = getattr(node, field, None)
+                if isinstance(children, list):
+                    stack.extend(children)
 
     return sorted(set(imports))
 
@@ -2,10 +2,14 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
+import os
 import sys
 import logging
 import traceback
-from typing import List, TYPE_CHECKING
+import multiprocessing
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -13,12 +17,16 @@ from typing import List, TYPE_CHECKING
 from src.analyzers import *
 from src.renderers import *
 from src.tools.scanner import scanner
+from src.utils.maps import dependencies_map
 from helpers.traces import error_trace
 from common.constants import ALGORITHM
+from handlers.logger import HandlerLogger
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from src.models import ModuleInfo
     from common.settings import Settings
+    from multiprocessing.queues import Queue
 # ---------------------------------------------------------------------------------------------------------------------
 
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
@@ -29,13 +37,20 @@ logger = logging.getLogger(ALGORITHM)
 Instance of the logger used by the analysis module.
 """
 
+PARALLEL_THRESHOLD = 500
+"""
+Minimum number of files from which the analysis is distributed among several processes; below it, 
+the cost of starting the processes is greater than the time saved.
+"""
+
 def execute(settings: Settings) -> None:
     """
     Executes the main flow of automatic documentation generation for the project.
 
     **This function coordinates all stages of the Codemnesis process:**
         1. Scans the specified repository for files in the supported language.
-        2. Analyzes each file found to extract its structure (classes, functions, and docstrings).
+        2. Analyzes each file found to extract its structure (classes, functions, and docstrings), using 
+        several processes when the repository is large enough.
         3. Generates a README file with the consolidated documentation.
         4. Generates a visual dependency graph between modules.
 
@@ -47,27 +62,92 @@ def execute(settings: Settings) -> None:
     files = list(scanner(settings.repository, settings.included, settings.excluded))
     logger.info(f"Number of {settings.framework} files found: {len(files)}")
     
-    analyze_method = globals().get(f'analyze_{settings.framework}')
+    if len(files) < PARALLEL_THRESHOLD or (os.cpu_count() or 1) < 2:
+        results = [_analyze(file, settings.framework) for file in files]
+    else:
+        results = _analyze_parallel(files, settings.framework)
 
-    modules: List[ModuleInfo] = []
-    for file in files:
-        try:
-            modules.append(analyze_method(file, settings.framework))
-        except Exception as error:
-            traces = traceback.extract_tb(error.__traceback__)
-            error_trace(traces, logger, error)
+    modules: List[ModuleInfo] = [module for module in results if module is not None]
 
     logger.info(f"Generating README ...")
     readme_path = render_readme(modules, settings.repository, settings.output)
     logger.info(f"README generated: {readme_path}")
 
+    # The dependency map is shared by the graph and the report, so it is only built once
+    dep_map = dependencies_map(modules, settings.repository, settings.framework)
+
     logger.info("Generating dependency graph ...")
-    graphic_path = render_graphic(modules, settings.output, settings.repository, settings.framework)
+    graphic_path = render_graphic(modules, settings.output, settings.repository, settings.framework, dep_map=dep_map)
     logger.info(f"Dependency graph generated: {graphic_path}")
 
     logger.info("Generating report ...")
-    report_path = render_report(modules, settings.output, settings.repository, settings.framework)
+    report_path = render_report(modules, settings.output, settings.repository, settings.framework, dep_map=dep_map)
     logger.info(f"Report generated: {report_path}")
 
+def _analyze(file: Path, framework: str) -> Optional[ModuleInfo]:
+    """
+    Analyzes a single file with the analyzer corresponding to the framework.
+
+    Any error is recorded in the logger and does not stop the analysis of the rest of the files.
+
+    Args:
+        file (Path):
+            Path of the file to be analyzed.
+        framework (str):
+            Name of the framework used, which must have a compatible mapping method.
+
+    Returns:
+        (ModuleInfo | None):
+            Structural information of the file, or None if it could not be analyzed.
+    """
+    analyze_method = globals().get(f'analyze_{framework}')
+
+    try:
+        return analyze_method(file, framework)
+    except Exception as error:
+        # The source lines are not read in advance, `error_trace` only needs the text of the frame it reports
+        traces = traceback.StackSummary.extract(traceback.walk_tb(error.__traceback__), lookup_lines=False)
+        error_trace(traces, logger, error)
+        return None
+
+def _analyze_parallel(files: List[Path], framework: str, *, chunksize: int = 16) -> List[Optional[ModuleInfo]]:
+    """
+    Distributes the analysis of the files among several processes, one per available core.
+
+    Each file is analyzed independently, so the results are identical to those of the sequential 
+    analysis and are returned in the same order as `files`. The records that the workers send to 
+    the logger are forwarded through a queue and written by the main process.
+
+    **Notes:**
+        - The `spawn` method is used on all platforms, so the behavior is the same as on Windows.
+
+    Args:
+        files (List[Path]):
+            Paths of the files to be analyzed.
+        framework (str):
+            Name of the framework used, which must have a compatible mapping method.
+        chunksize (int, optional):
+            Number of files sent to a worker in each task.
+
+    Returns:
+        List:
+            Result of `_analyze` for each file.
+    """
+    context = multiprocessing.get_context('spawn')
+    queue: Queue = context.Queue()
+
+    listener = HandlerLogger.listener(queue)
+    listener.start()
+
+    try:
+        with ProcessPoolExecutor(
+            mp_context=context, 
+            initializer=HandlerLogger.set_worker, 
+            initargs=(queue,)
+        ) as executor:
+            return list(executor.map(_analyze, files, repeat(framework), chunksize=chunksize))
+    finally:
+        listener.stop() # Writes any pending record before returning
+
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
@@ -14,7 +14,7 @@ from typing import List, Dict, Union
 
 __all__ = ['ModuleMetrics', 'RepositoryMetrics']
 
-@dataclass
+@dataclass(slots=True)
 class ModuleMetrics:
     """
     It contains basic metrics extracted from a source module.
@@ -37,7 +37,7 @@ class ModuleMetrics:
     n_functions: int
     n_methods: int
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryMetrics:
     """
     Contains the overall metrics obtained from the analysis of a repository.
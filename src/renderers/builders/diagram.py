@@ -8,6 +8,7 @@ from typing import List, Dict, Set
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from src.tools.paths import absolute_path
 from src.utils.maps import identifiers_map
 from common.constants import ALGORITHM_VERSION
 # ---------------------------------------------------------------------------------------------------------------------
@@ -82,10 +83,14 @@ def dependency_diagram(repository: str, dep_map: Dict[str, Set[str]], file_forma
 
     root = Path(repository).resolve()
     groups: Dict[str, List[str]] = {}
+
+    # The folder of each module is resolved only once, it is reused when creating the edges
+    group_of: Dict[str, str] = {}
     for path in all_path:
-        parent = Path(path).resolve().parent
+        parent = absolute_path(path).parent
         relative = parent.relative_to(root)
         group_key = relative.as_posix() if str(relative) != '.' else 'root'
+        group_of[path] = group_key
         groups.setdefault(group_key, []).append(path)
 
     # For each folder (group), two subgraphs are created:
@@ -120,15 +125,11 @@ def dependency_diagram(repository: str, dep_map: Dict[str, Set[str]], file_forma
 
     # Creation of dependency edges between modules
     for src, targets in dep_map.items():
-        src_parent = Path(src).resolve().parent
-        src_relative = src_parent.relative_to(root)
-        src_group = src_relative.as_posix() if str(src_relative) != '.' else 'root'
+        src_group = group_of[src]
         src_id = id_map[src]
 
         for dest in targets:
-            dest_parent = Path(dest).resolve().parent
-            dest_relative = dest_parent.relative_to(root)
-            dest_group = dest_relative.as_posix() if str(dest_relative) != '.' else 'root'
+            dest_group = group_of[dest]
             dest_id = id_map[dest]
 
             same_group = (src_group == dest_group)
@@ -8,6 +8,7 @@ from typing import List, Dict, Union, Set, TYPE_CHECKING
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from src.tools.paths import absolute_path
 from src.tools.nums import percentage, average
 
 if TYPE_CHECKING:
@@ -483,6 +484,8 @@ def internal_dependencies(
         reverse=True
     )[:limit]
 
+    root = Path(repository).resolve() # Resolved only once, it is the base of all module paths
+
     core_modules = []
     for module in most_referenced:
         indeg = in_degree.get(module, 0)
@@ -493,7 +496,7 @@ def internal_dependencies(
         # Excluding self-reference potential
         reference_percetage = percentage(indeg, max(1, num_modules - 1))
 
-        name = Path(module).resolve().relative_to(Path(repository).resolve()).name
+        name = absolute_path(module).relative_to(root).name
         core_modules.append(f'{name}: referenced by \u007e{reference_percetage}\u0025 of the files in the repository.')
 
     if core_modules:
@@ -8,6 +8,7 @@ from typing import List, Optional, TYPE_CHECKING
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from src.tools.paths import absolute_path
 from src.tools.docstring import format_docstring
 from common.constants import ALGORITHM_VERSION, NO_METHOD, NO_FUNCTION, NO_CLASS, NO_MODULE, NO_ATTRIBUTE
 
@@ -43,10 +44,11 @@ def generate_content(modules: List[ModuleInfo], repository: str, *, cleaned: Opt
 
     lines: List[str] = []
     lines.append(f'# 📑 Documentation generated by Codemnesis - v.{ALGORITHM_VERSION}\n')
-    lines.append(f'## 🗃️ *Repository analyzed*: `{Path(repository).resolve().name}`\n')
+    root = Path(repository).resolve() # Resolved only once, it is the base of all module paths
+    lines.append(f'## 🗃️ *Repository analyzed*: `{root.name}`\n')
 
     for module in sorted(modules, key=lambda module: module.path):
-        relative = Path(module.path).resolve().relative_to(Path(repository).resolve())
+        relative = absolute_path(module.path).relative_to(root)
         lines.append(f'## 🗂️ Module: `{relative.as_posix()}`\n')
 
         if not module.classes and not module.functions:
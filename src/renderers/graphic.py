@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Dict, Set, TYPE_CHECKING
+from typing import List, Dict, Set, Optional, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -28,7 +28,8 @@ def render_graphic(
     repository: str, 
     framework: str, 
     *, 
-    file_format: str = 'svg'
+    file_format: str = 'svg',
+    dep_map: Optional[Dict[str, Set[str]]] = None
 ) -> Path:
     """
     Generates the dependency graph found between the analyzed modules.
@@ -48,15 +49,20 @@ def render_graphic(
             Name of the framework used, which must have a compatible mapping method.
         file_format (str, optional):
             Final format of the graph file.
+        dep_map (Dict[str, Set[str]], optional):
+            Dependency map already built with `dependencies_map`, it is calculated if not provided.
     
     Returns:
         Path:
             Absolute path of the generated output file.
     """
     out = Path(output) / f'{FILE}.{file_format}'
-    dep_map = dependencies_map(modules, repository, framework)
+    if dep_map is None:
+        dep_map = dependencies_map(modules, repository, framework)
+
     graph = dependency_diagram(repository, dep_map, file_format)
-    graph.render(out.with_suffix(''), cleanup=True)
+    # The output is received directly from Graphviz, without writing and deleting an intermediate DOT file
+    out.write_bytes(graph.pipe())
     return out
 
 # ---------------------------------------------------------------------------------------------------------------------
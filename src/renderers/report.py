@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime
-from typing import List, TYPE_CHECKING
+from typing import List, Dict, Set, Optional, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -29,7 +29,14 @@ __all__ = ['render_report']
 
 PDF_FILE = 'Analysis-Report.pdf'
 
-def render_report(modules: List[ModuleInfo], output: str, repository: str, framework: str) -> Path:
+def render_report(
+    modules: List[ModuleInfo], 
+    output: str, 
+    repository: str, 
+    framework: str, 
+    *, 
+    dep_map: Optional[Dict[str, Set[str]]] = None
+) -> Path:
     """
     Generates a PDF report of technical analysis for a repository.
 
@@ -47,6 +54,8 @@ def render_report(modules: List[ModuleInfo], output: str, repository: str, frame
             Base path of the repository or project to be analyzed.
         framework (str):
             Name of the framework used, which must have a compatible mapping method.
+        dep_map (Dict[str, Set[str]], optional):
+            Dependency map already built with `dependencies_map`, it is calculated if not provided.
 
     Returns:
         Path:
@@ -64,7 +73,9 @@ def render_report(modules: List[ModuleInfo], output: str, repository: str, frame
 
     hotspots = hotspots_modules(statistics.sloc, statistics.module_stats)
 
-    dep_map = dependencies_map(modules, repository, framework)
+    if dep_map is None:
+        dep_map = dependencies_map(modules, repository, framework)
+
     dependencies = internal_dependencies(dep_map, repository)
 
     doc = Document(str(out))
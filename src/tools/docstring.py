@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Tuple, Optional
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -57,8 +57,25 @@ def _clean(doc: str, cleaned: List[str]) -> str:
             Text without special characters or formatting symbols.
     """
     text = doc.strip()
-    pattern = re.compile('|'.join(re.escape(token) for token in cleaned))
-    return pattern.sub('', text)
+    return _pattern(tuple(cleaned)).sub('', text)
+
+@lru_cache(maxsize=32)
+def _pattern(tokens: Tuple[str, ...]) -> re.Pattern:
+    """
+    Builds the regular expression that matches any of the tokens to be removed.
+
+    The same tokens are used for every docstring of the README, so the expression is built 
+    and compiled only once instead of on each call to `_clean`.
+
+    Args:
+        tokens (Tuple[str, ...]):
+            Tokens to be removed, as a tuple so that they can be used as cache key.
+
+    Returns:
+        Pattern:
+            Compiled expression that matches any of the tokens literally.
+    """
+    return re.compile('|'.join(re.escape(token) for token in tokens))
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
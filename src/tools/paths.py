@@ -0,0 +1,40 @@
+# MODULES (EXTERNAL)
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+from pathlib import Path
+# ---------------------------------------------------------------------------------------------------------------------
+
+# MODULES (INTERNAL)
+# ---------------------------------------------------------------------------------------------------------------------
+# Get listed here!
+# ---------------------------------------------------------------------------------------------------------------------
+
+# OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
+# ---------------------------------------------------------------------------------------------------------------------
+
+def absolute_path(path: str) -> Path:
+    """
+    Obtains the absolute path of an analyzed module.
+
+    The paths produced by `scanner` are already absolute and start from the resolved root of the
+    repository, so for them a purely textual normalization is enough and `Path.resolve()` (which
+    queries the file system for every component) is only used for relative paths.
+
+    **Notes:**
+        - Symbolic links to files are not followed, the module is located where the scanner found it.
+
+    Args:
+        path (str):
+            Path of the module, as stored in `ModuleInfo.path`.
+
+    Returns:
+        Path:
+            Absolute and normalized path of the module.
+    """
+    if os.path.isabs(path):
+        return Path(os.path.normpath(path))
+
+    return Path(path).resolve()
+
+# ---------------------------------------------------------------------------------------------------------------------
+# END OF FILE
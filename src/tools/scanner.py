@@ -33,13 +33,29 @@ def scanner(repository: str, included: Set[str], excluded: Set[str]) -> Iterator
     root = Path(repository).resolve()
 
     for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
-        dirnames[:] = [dirname for dirname in dirnames if dirname not in excluded]
+        # In most directories nothing is excluded, so the list is only rebuilt when needed
+        if not excluded.isdisjoint(dirnames):
+            dirnames[:] = [dirname for dirname in dirnames if dirname not in excluded]
 
         for filename in filenames:
-            path = Path(dirpath) / filename
-            
-            if path.suffix in included:
-                yield path
+            # The `Path` object is only created for the files that are going to be returned
+            if _suffix(filename) in included:
+                yield Path(dirpath, filename)
+
+def _suffix(filename: str) -> str:
+    """
+    Obtains the extension of a file name, with the same criteria as `Path.suffix`.
+
+    Args:
+        filename (str):
+            Name of the file, without directories.
+
+    Returns:
+        str:
+            Extension of the file including the dot, or an empty string if it does not have one.
+    """
+    idx = filename.rfind('.')
+    return filename[idx:] if 0 < idx < len(filename) - 1 else ''
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, List, Dict, Set
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from src.tools.paths import absolute_path
+
 if TYPE_CHECKING:
     from src.models import ModuleInfo
 # ---------------------------------------------------------------------------------------------------------------------
@@ -133,6 +135,7 @@ def _physical_paths(modules: List[ModuleInfo], repository: str, framework: str)
             When the framework does not have a registered compatible method.
     """
     dct = {}
+    root = Path(repository).resolve() # Resolved only once, it is the base of all module paths
 
     for module in modules:
         if framework == 'csharp': # Imports are prefixed with __ns__: to distinguish them from regular imports
@@ -141,7 +144,7 @@ def _physical_paths(modules: List[ModuleInfo], repository: str, framework: str)
                     ns = imp[len('__ns__:'):]
                     dct.setdefault(ns, set()).add(module.path)
         elif framework == 'python': # Converts absolute path → relative path → module name
-            relative = Path(module.path).resolve().relative_to(Path(repository).resolve())
+            relative = absolute_path(module.path).relative_to(root)
             name = relative.with_suffix('').as_posix().replace('/', '.')
             dct.setdefault(name, set()).add(module.path)
 
@@ -8,6 +8,7 @@ from typing import List, TYPE_CHECKING
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from src.tools.paths import absolute_path
 from src.tools.nums import percentage
 from src.models import ModuleMetrics, RepositoryMetrics
 
@@ -36,15 +37,17 @@ def module_metrics(src: str, classes: List[ClassInfo], funcs: List[FunctionInfo]
         ModuleMetrics:
             Object containing all the metrics calculated for the analyzed file.
     """
+    lines = src.splitlines() # Split only once, it is shared by the LOC and SLOC calculations
+
     if framework == 'python':
-        sloc = _sloc_python(src)
+        sloc = _sloc_python(lines)
     elif framework == 'csharp':
-        sloc = _sloc_csharp(src)
+        sloc = _sloc_csharp(lines)
     else:
-        sloc = sum(1 for line in src.splitlines() if line.strip()) # Conservative fallback: only ignore empty lines
+        sloc = sum(1 for line in lines if line.strip()) # Conservative fallback: only ignore empty lines
 
     return ModuleMetrics(
-        loc=len(src.splitlines()),
+        loc=len(lines),
         sloc=sloc,
         n_classes=len(classes),
         n_functions=len(funcs),
@@ -89,6 +92,8 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
 
     module_stats = []
     modules_overview = []
+
+    root = Path(repository).resolve() # Resolved only once, it is the base of all module paths
     
     for module in sorted(modules, key=lambda module: module.path):
         metrics = module.metrics
@@ -96,7 +101,7 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
         if not metrics:
             continue
 
-        module_name = Path(module.path).resolve().relative_to(Path(repository).resolve()).name
+        module_name = absolute_path(module.path).relative_to(root).name
 
         loc += metrics.loc or 0
         sloc += metrics.sloc or 0
@@ -164,7 +169,7 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
         attribute_percent=percentage(documented_attributes, attributes)
     )
 
-def _sloc_python(src: str) -> int:
+def _sloc_python(lines: List[str]) -> int:
     """
     Calculate the number of effective lines of code (SLOC) for a Python file.
 
@@ -176,15 +181,15 @@ def _sloc_python(src: str) -> int:
     not perform any kind of syntactic analysis using AST.
 
     Args:
-        src (str):
-            Full content of the source file.
+        lines (List[str]):
+            Lines of the source file.
 
     Returns:
         int:
             Number of lines of code (SLOC) detected.
     """
     count = 0
-    for line in src.splitlines():
+    for line in lines:
         stripped = line.strip()
         if not stripped:
             continue
@@ -196,7 +201,7 @@ def _sloc_python(src: str) -> int:
 
     return count
 
-def _sloc_csharp(src: str) -> int:
+def _sloc_csharp(lines: List[str]) -> int:
     """
     Calculate the number of effective lines of code (SLOC) for a C# file.
 
@@ -219,8 +224,8 @@ def _sloc_csharp(src: str) -> int:
         - The calculation is approximate, but accurate for metrics of structural analysis and documentation.
 
     Args:
-        src (str):
-            Full content of the source file.
+        lines (List[str]):
+            Lines of the source file.
 
     Returns:
         int:
@@ -229,7 +234,7 @@ def _sloc_csharp(src: str) -> int:
     count = 0
     in_block = False
 
-    for line in src.splitlines():
+    for line in lines:
         stripped = line.strip()
         if not stripped:
             continue